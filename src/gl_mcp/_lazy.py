@@ -0,0 +1,30 @@
+"""Lazily created process-wide instances."""
+
+import threading
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class Lazy(Generic[T]):
+    """A value created by a factory on first use and shared thereafter.
+
+    After creation, get() is a plain attribute read; the lock is only taken
+    while the value does not exist yet, so concurrent first calls create it once.
+    """
+
+    def __init__(self, factory: Callable[[], T]):
+        self._factory = factory
+        self._value: T | None = None
+        self._lock = threading.Lock()
+
+    def get(self) -> T:
+        """Return the value, creating it on the first call."""
+        value = self._value
+        if value is not None:
+            return value
+        with self._lock:
+            if self._value is None:
+                self._value = self._factory()
+            return self._value
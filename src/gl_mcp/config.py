@@ -1,18 +1,15 @@
-"""Application configuration using Pydantic settings."""
+"""Application configuration loaded into a msgspec struct."""
 
-from functools import lru_cache
+import os
 
-from pydantic_settings import BaseSettings, SettingsConfigDict
+import msgspec
+from dotenv import dotenv_values
 
+from gl_mcp._lazy import Lazy
 
-class Settings(BaseSettings):
-    """Application settings loaded from environment variables."""
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-    )
+class Settings(msgspec.Struct, frozen=True):
+    """Application settings loaded from environment variables."""
 
     # Server
     host: str = "0.0.0.0"
@@ -20,10 +17,15 @@ class Settings(BaseSettings):
     log_level: str = "info"
     debug: bool = False
 
+    # MCP sessions
+    max_sessions: int = 1000
+    session_ttl_seconds: int = 3600
+
     # JIRA
     jira_url: str = ""
     jira_username: str = ""
     jira_api_token: str = ""
+    jira_verify_on_startup: bool = False
 
     # GL News Database
     glnews_db_host: str = ""
@@ -54,7 +56,45 @@ class Settings(BaseSettings):
     vault_github_token: str = ""
 
 
-@lru_cache
+# Boolean spellings accepted by pydantic, normalized before conversion
+_BOOL_STRINGS = {
+    **dict.fromkeys(("1", "true", "t", "yes", "y", "on"), "true"),
+    **dict.fromkeys(("0", "false", "f", "no", "n", "off"), "false"),
+}
+_BOOL_FIELDS = frozenset(
+    field.name for field in msgspec.structs.fields(Settings) if field.type is bool
+)
+
+
 def get_settings() -> Settings:
     """Get cached settings instance."""
-    return Settings()
+    return _settings.get()
+
+
+def _load(env_file: str = ".env") -> Settings:
+    """Build settings from the .env file and environment variables.
+
+    Variable names are matched case-insensitively; environment variables
+    take precedence over the .env file and unknown names are ignored.
+
+    Raises:
+        ValueError: If a variable cannot be converted to its setting's type
+    """
+    fields = set(Settings.__struct_fields__)
+    values: dict[str, str] = {}
+    for source in (dotenv_values(env_file), os.environ):
+        for key, value in source.items():
+            name = key.lower()
+            if name in fields and value is not None:
+                if name in _BOOL_FIELDS:
+                    value = _BOOL_STRINGS.get(value.strip().lower(), value)
+                values[name] = value
+    try:
+        return msgspec.convert(values, Settings, strict=False)
+    except msgspec.ValidationError as e:
+        # msgspec reports the field as "... - at `$.name`"; name the variable instead
+        message, _, path = str(e).partition(" - at `$.")
+        raise ValueError(f"Invalid value for {path.rstrip('`').upper()}: {message}") from e
+
+
+_settings: Lazy[Settings] = Lazy(_load)
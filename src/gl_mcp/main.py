@@ -1,11 +1,16 @@
 """FastAPI application entrypoint."""
 
 import logging
+import sys
+from collections.abc import Mapping
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from fastapi import FastAPI
+import orjson
+import uvicorn
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from gl_mcp import __version__
 from gl_mcp.config import get_settings
@@ -14,10 +19,20 @@ from gl_mcp.providers import (
     get_provider_registry,
     initialize_providers,
     register_all_providers,
+    shutdown_providers,
 )
 
 logger = logging.getLogger(__name__)
 
+# Pre-encoded response bodies; see _health_response
+_ROOT_BODY = orjson.dumps({
+    "service": "gl-mcp-python",
+    "version": __version__,
+    "docs": "/docs",
+})
+_health_prefix: bytes | None = None
+_providers_cache: tuple[Mapping[str, bool], bytes] | None = None
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -37,8 +52,32 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     for name, status in provider_status.items():
         logger.info(f"Provider '{name}': {'ready' if status else 'unavailable'}")
 
+    _encode_health_prefix()
+
     yield
     logger.info("Shutting down gl-mcp-python")
+    await shutdown_providers()
+
+
+class HealthCheckMiddleware:
+    """Answer GET /health before the rest of the middleware stack.
+
+    Liveness probes are the highest-traffic requests, and the health
+    response does not need CORS handling.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] == "http"
+            and scope["path"] == "/health"
+            and scope["method"] in ("GET", "HEAD")
+        ):
+            await _health_response()(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
 
 
 app = FastAPI(
@@ -56,31 +95,79 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Added last so it wraps CORSMiddleware
+app.add_middleware(HealthCheckMiddleware)
+
 # Include MCP router
 app.include_router(get_mcp_router())
 
 
-@app.get("/health")
-async def health_check() -> dict:
-    """Health check endpoint."""
+def _encode_health_prefix() -> bytes:
+    """Encode the static part of the health response (everything but providers/sessions)."""
+    global _health_prefix
     settings = get_settings()
-    registry = get_provider_registry()
-
-    return {
+    static = orjson.dumps({
         "status": "healthy",
         "service": "gl-mcp-python",
         "version": __version__,
         "auth": "enabled" if settings.auth_enabled else "disabled",
-        "providers": await registry.check_all_credentials(),
-        "sessions": get_session_count(),
-    }
+    })
+    # Drop the closing brace so the dynamic fields can be appended
+    _health_prefix = static[:-1] + b","
+    return _health_prefix
+
+
+def _encode_providers(snapshot: Mapping[str, bool]) -> bytes:
+    """Encode provider status, reusing the last encoding while the snapshot is unchanged."""
+    global _providers_cache
+    cached = _providers_cache
+    if cached is None or cached[0] is not snapshot:
+        cached = (snapshot, orjson.dumps(dict(snapshot)))
+        _providers_cache = cached
+    return cached[1]
+
+
+def _health_response() -> Response:
+    """Build the health check response."""
+    prefix = _health_prefix or _encode_health_prefix()
+    providers = _encode_providers(get_provider_registry().check_all_credentials())
+
+    return Response(
+        content=b"".join((
+            prefix,
+            b'"providers":',
+            providers,
+            b',"sessions":',
+            str(get_session_count()).encode(),
+            b"}",
+        )),
+        media_type="application/json",
+    )
+
+
+@app.get("/health")
+async def health_check() -> Response:
+    """Health check endpoint.
+
+    Normally served by HealthCheckMiddleware; the route keeps it in the API docs.
+    """
+    return _health_response()
 
 
 @app.get("/")
-async def root() -> dict[str, str]:
+async def root() -> Response:
     """Root endpoint."""
-    return {
-        "service": "gl-mcp-python",
-        "version": __version__,
-        "docs": "/docs",
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
+
+
+def run() -> None:
+    """Run the server with uvloop and httptools."""
+    settings = get_settings()
+    uvicorn.run(
+        "gl_mcp.main:app",
+        host=settings.host,
+        port=settings.port,
+        log_level=settings.log_level,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+    )
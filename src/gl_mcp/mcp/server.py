@@ -1,32 +1,43 @@
 """MCP Server setup and management."""
 
 import logging
-from typing import Callable
-from uuid import uuid4
+from collections.abc import Awaitable, Callable
+from typing import Any, NamedTuple
 
+import orjson
 from mcp.server import Server
-from mcp.types import Tool, TextContent
+from mcp.types import Tool
 
 from gl_mcp import __version__
+from gl_mcp._lazy import Lazy
 
 logger = logging.getLogger(__name__)
 
 
+class _ToolEntry(NamedTuple):
+    """A registered tool with its tools/list payload and handler."""
+
+    tool: Tool
+    payload: dict[str, Any]
+    handler: Callable[..., Awaitable[Any]]
+
+
 class MCPServerManager:
     """Manages MCP server instances and tool registration."""
 
     def __init__(self, name: str = "gl-mcp", version: str = __version__):
         self.name = name
         self.version = version
-        self._tool_handlers: dict[str, Callable] = {}
-        self._tools: list[Tool] = []
+        self._entries: dict[str, _ToolEntry] = {}
+        self._tools_payload: list[dict[str, Any]] | None = None
+        self._tools_list_encoded: bytes | None = None
 
     def register_tool(
         self,
         name: str,
         description: str,
-        input_schema: dict,
-        handler: Callable,
+        input_schema: dict[str, Any],
+        handler: Callable[..., Awaitable[Any]],
     ) -> None:
         """Register a tool with the MCP server.
 
@@ -41,10 +52,28 @@ class MCPServerManager:
             description=description,
             inputSchema=input_schema,
         )
-        self._tools.append(tool)
-        self._tool_handlers[name] = handler
+        payload = {
+            "name": name,
+            "description": description,
+            "inputSchema": input_schema,
+        }
+        self._entries[name] = _ToolEntry(tool, payload, handler)
+        self._tools_payload = None
+        self._tools_list_encoded = None
         logger.debug(f"Registered tool: {name}")
 
+    def unregister_tool(self, name: str) -> None:
+        """Remove a tool so it is no longer listed or callable.
+
+        Args:
+            name: Tool name passed to register_tool
+        """
+        if self._entries.pop(name, None) is None:
+            return
+        self._tools_payload = None
+        self._tools_list_encoded = None
+        logger.debug(f"Unregistered tool: {name}")
+
     def create_server(self, user_roles: list[str] | None = None) -> Server:
         """Create a new MCP Server instance.
 
@@ -59,54 +88,83 @@ class MCPServerManager:
         # Register list_tools handler
         @server.list_tools()
         async def list_tools():
-            return self._tools
+            return [entry.tool for entry in self._entries.values()]
 
         # Register call_tool handler
         @server.call_tool()
-        async def call_tool(name: str, arguments: dict):
-            if name not in self._tool_handlers:
-                return [TextContent(type="text", text=f"Unknown tool: {name}")]
-
-            try:
-                handler = self._tool_handlers[name]
-                result = await handler(**arguments)
-
-                # Normalize result to list of content
-                if isinstance(result, str):
-                    return [TextContent(type="text", text=result)]
-                elif isinstance(result, list):
-                    return result
-                else:
-                    return [TextContent(type="text", text=str(result))]
-
-            except Exception as e:
-                logger.exception(f"Error executing tool {name}")
-                return [TextContent(type="text", text=f"Error: {str(e)}")]
-
-        logger.info(f"Created MCP server with {len(self._tools)} tools")
+        async def call_tool(name: str, arguments: dict[str, Any]):
+            return await self.call_tool(name, arguments)
+
+        logger.info(f"Created MCP server with {len(self._entries)} tools")
         return server
 
+    async def call_tool(self, name: str, arguments: dict[str, Any]) -> list[dict[str, Any]]:
+        """Call a registered tool.
+
+        Args:
+            name: Tool name
+            arguments: Tool arguments
+
+        Returns:
+            List of MCP content dicts (e.g., {"type": "text", "text": ...})
+        """
+        entry = self._entries.get(name)
+        if entry is None:
+            return [{"type": "text", "text": f"Unknown tool: {name}"}]
+
+        try:
+            result = await entry.handler(**arguments)
+        except Exception as e:
+            logger.exception(f"Error executing tool {name}")
+            return [{"type": "text", "text": f"Error: {str(e)}"}]
+
+        # Normalize result to list of content
+        if isinstance(result, str):
+            return [{"type": "text", "text": result}]
+        elif isinstance(result, list):
+            return [
+                c if isinstance(c, dict) else c.model_dump(mode="json", exclude_none=True)
+                for c in result
+            ]
+        else:
+            return [{"type": "text", "text": str(result)}]
+
     @property
     def tool_count(self) -> int:
         """Return the number of registered tools."""
-        return len(self._tools)
+        return len(self._entries)
+
+    @property
+    def tools_payload(self) -> list[dict[str, Any]]:
+        """Return registered tools as plain dicts for the tools/list response."""
+        payload = self._tools_payload
+        if payload is None:
+            payload = [entry.payload for entry in self._entries.values()]
+            self._tools_payload = payload
+        return payload
+
+    @property
+    def tools_list_encoded(self) -> bytes:
+        """Return the JSON-encoded tools/list result."""
+        encoded = self._tools_list_encoded
+        if encoded is None:
+            encoded = orjson.dumps({"tools": self.tools_payload})
+            self._tools_list_encoded = encoded
+        return encoded
 
     @property
     def tool_names(self) -> list[str]:
         """Return list of registered tool names."""
-        return list(self._tool_handlers.keys())
+        return list(self._entries.keys())
 
 
 # Global server manager instance
-_server_manager: MCPServerManager | None = None
+_server_manager: Lazy[MCPServerManager] = Lazy(MCPServerManager)
 
 
 def get_server_manager() -> MCPServerManager:
     """Get or create the global server manager."""
-    global _server_manager
-    if _server_manager is None:
-        _server_manager = MCPServerManager()
-    return _server_manager
+    return _server_manager.get()
 
 
 def create_mcp_server(user_roles: list[str] | None = None) -> Server:
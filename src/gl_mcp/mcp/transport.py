@@ -1,25 +1,92 @@
 """MCP Transport implementations for FastAPI integration."""
 
 import asyncio
-import json
 import logging
+import os
+import sys
+import threading
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
 from typing import Any
-from uuid import uuid4
 
+import orjson
+from cachetools import TTLCache
 from fastapi import APIRouter, Request, Response
 from fastapi.responses import StreamingResponse
-from mcp.server import Server
 from mcp.types import JSONRPCMessage
 
-from gl_mcp.mcp.server import create_mcp_server
+from gl_mcp import __version__
+from gl_mcp.config import get_settings
+from gl_mcp.mcp.server import get_server_manager
 
 logger = logging.getLogger(__name__)
 
+# Static result for initialize requests
+_INIT_RESULT: dict[str, Any] = {
+    "protocolVersion": "2024-11-05",
+    "serverInfo": {
+        "name": "gl-mcp-python",
+        "version": __version__,
+    },
+    "capabilities": {
+        "tools": {"listChanged": False},
+    },
+}
+
+# Seconds between SSE keep-alive comments
+_KEEPALIVE_INTERVAL = 30
+
+# Pre-serialized ping response; __ID__ is replaced with the encoded request id
+_PING_TEMPLATE = b'{"jsonrpc":"2.0","id":__ID__,"result":{}}'
+
+
+@dataclass(slots=True)
+class Session:
+    """State for an active MCP session."""
+
+    user_roles: list[str]
+    message_queue: asyncio.Queue[dict[str, Any]] | None = None
+
+
+class _SessionCache(TTLCache[str, Session]):
+    """Bounded LRU session store whose entries expire after a period of inactivity."""
+
+    def popitem(self) -> tuple[str, Session]:
+        session_id, session = super().popitem()
+        _release_session(session_id, session, "evicted")
+        return session_id, session
+
+    def expire(self, time: float | None = None) -> list[tuple[str, Session]]:
+        expired = super().expire(time)
+        for session_id, session in expired:
+            _release_session(session_id, session, "expired")
+        return expired
+
+
+def _release_session(session_id: str, session: Session, reason: str) -> None:
+    """Drop resources held by a session removed from the store."""
+    session.message_queue = None
+    logger.info(f"MCP session {reason}: {session_id}")
+
+
+# Random bytes per session ID, and IDs drawn from each os.urandom call
+_SESSION_ID_BYTES = 16
+_SESSION_ID_BATCH = 32
+_session_id_pool: deque[bytes] = deque()
+
 # Session storage for active MCP sessions
-_sessions: dict[str, dict[str, Any]] = {}
+_settings = get_settings()
+_sessions: _SessionCache = _SessionCache(
+    maxsize=_settings.max_sessions,
+    ttl=_settings.session_ttl_seconds,
+)
+_sessions_lock = threading.Lock()
 
 
-def get_mcp_router(user_roles_extractor=None) -> APIRouter:
+def get_mcp_router(
+    user_roles_extractor: Callable[[Request], Awaitable[list[str]]] | None = None,
+) -> APIRouter:
     """Create FastAPI router for MCP endpoints.
 
     Args:
@@ -34,10 +101,10 @@ def get_mcp_router(user_roles_extractor=None) -> APIRouter:
     async def mcp_post(request: Request) -> Response:
         """Handle MCP POST requests (messages)."""
         try:
-            body = await request.json()
-        except Exception:
+            body = orjson.loads(await request.body())
+        except orjson.JSONDecodeError:
             return Response(
-                content=json.dumps({
+                content=orjson.dumps({
                     "jsonrpc": "2.0",
                     "error": {"code": -32700, "message": "Parse error"},
                     "id": None,
@@ -46,58 +113,49 @@ def get_mcp_router(user_roles_extractor=None) -> APIRouter:
                 media_type="application/json",
             )
 
+        # Intern the method name so the _DISPATCH lookup can succeed on identity
+        if isinstance(body, dict):
+            method = body.get("method")
+            if type(method) is str:
+                body["method"] = sys.intern(method)
+
         # Get or create session
-        session_id = request.headers.get("mcp-session-id")
+        session_id = request.headers.get("mcp-session-id", "")
+
+        session = _touch_session(session_id)
+
+        if session is None:
+            if not _is_initialize_request(body):
+                return Response(
+                    content=orjson.dumps({
+                        "jsonrpc": "2.0",
+                        "error": {"code": -32600, "message": "Invalid session"},
+                        "id": body.get("id") if isinstance(body, dict) else None,
+                    }),
+                    status_code=400,
+                    media_type="application/json",
+                )
 
-        if session_id and session_id in _sessions:
-            session = _sessions[session_id]
-        elif _is_initialize_request(body):
             # Create new session
-            session_id = str(uuid4())
+            session_id = _next_session_id()
             user_roles = []
             if user_roles_extractor:
                 user_roles = await user_roles_extractor(request)
 
-            server = create_mcp_server(user_roles)
-            session = {
-                "server": server,
-                "user_roles": user_roles,
-                "message_queue": asyncio.Queue(),
-            }
-            _sessions[session_id] = session
+            session = Session(user_roles=user_roles)
+            with _sessions_lock:
+                _sessions[session_id] = session
             logger.info(f"Created new MCP session: {session_id}")
-        else:
-            return Response(
-                content=json.dumps({
-                    "jsonrpc": "2.0",
-                    "error": {"code": -32600, "message": "Invalid session"},
-                    "id": body.get("id") if isinstance(body, dict) else None,
-                }),
-                status_code=400,
-                media_type="application/json",
-            )
+
+        headers = {"mcp-session-id": session_id}
 
         # Process the message
         try:
-            response = await _handle_message(session["server"], body)
-
-            headers = {"mcp-session-id": session_id}
-
-            if response is None:
-                # Notification - no response needed
-                return Response(status_code=202, headers=headers)
-
-            return Response(
-                content=json.dumps(response),
-                status_code=200,
-                media_type="application/json",
-                headers=headers,
-            )
-
+            return await _handle_message(body, headers)
         except Exception as e:
             logger.exception("Error processing MCP message")
             return Response(
-                content=json.dumps({
+                content=orjson.dumps({
                     "jsonrpc": "2.0",
                     "error": {"code": -32603, "message": str(e)},
                     "id": body.get("id") if isinstance(body, dict) else None,
@@ -109,9 +167,10 @@ def get_mcp_router(user_roles_extractor=None) -> APIRouter:
     @router.get("")
     async def mcp_get(request: Request) -> Response:
         """Handle MCP GET requests (SSE stream)."""
-        session_id = request.headers.get("mcp-session-id")
+        session_id = request.headers.get("mcp-session-id", "")
 
-        if not session_id or session_id not in _sessions:
+        session = _touch_session(session_id)
+        if session is None:
             return Response(
                 content="Invalid or missing session ID",
                 status_code=400,
@@ -124,22 +183,33 @@ def get_mcp_router(user_roles_extractor=None) -> APIRouter:
                 status_code=405,
             )
 
-        async def event_generator():
+        async def event_generator() -> AsyncIterator[bytes]:
             """Generate SSE events."""
-            session = _sessions.get(session_id)
-            if not session:
-                return
-
-            queue = session["message_queue"]
+            # Created on first SSE connect; most sessions never open a stream
+            queue = session.message_queue
+            if queue is None:
+                queue = asyncio.Queue()
+                session.message_queue = queue
+
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + _KEEPALIVE_INTERVAL
             try:
                 while True:
                     try:
-                        # Wait for messages with timeout for keep-alive
-                        message = await asyncio.wait_for(queue.get(), timeout=30)
-                        yield f"data: {json.dumps(message)}\n\n"
-                    except asyncio.TimeoutError:
+                        # Wait for messages until the next keep-alive is due
+                        async with asyncio.timeout_at(deadline):
+                            message = await queue.get()
+                    except TimeoutError:
+                        # End the stream once the session has expired or been
+                        # evicted; an open stream otherwise keeps it alive
+                        if not _keep_session_alive(session_id, session):
+                            logger.debug(f"SSE stream closed for ended session {session_id}")
+                            return
                         # Send keep-alive
-                        yield ": keep-alive\n\n"
+                        deadline = loop.time() + _KEEPALIVE_INTERVAL
+                        yield b": keep-alive\n\n"
+                        continue
+                    yield b"data: " + orjson.dumps(message) + b"\n\n"
             except asyncio.CancelledError:
                 logger.debug(f"SSE stream cancelled for session {session_id}")
 
@@ -156,10 +226,9 @@ def get_mcp_router(user_roles_extractor=None) -> APIRouter:
     @router.delete("")
     async def mcp_delete(request: Request) -> Response:
         """Handle MCP DELETE requests (session termination)."""
-        session_id = request.headers.get("mcp-session-id")
+        session_id = request.headers.get("mcp-session-id", "")
 
-        if session_id and session_id in _sessions:
-            del _sessions[session_id]
+        if session_id and _remove_session(session_id):
             logger.info(f"Terminated MCP session: {session_id}")
             return Response(status_code=200)
 
@@ -168,6 +237,44 @@ def get_mcp_router(user_roles_extractor=None) -> APIRouter:
     return router
 
 
+def _next_session_id() -> str:
+    """Generate a random 128-bit session ID as 32 hex characters."""
+    try:
+        chunk = _session_id_pool.popleft()
+    except IndexError:
+        n = _SESSION_ID_BYTES
+        block = os.urandom(n * _SESSION_ID_BATCH)
+        _session_id_pool.extend(block[i:i + n] for i in range(n, len(block), n))
+        chunk = block[:n]
+    return chunk.hex()
+
+
+def _touch_session(session_id: str) -> Session | None:
+    """Look up an active session and refresh its expiry time."""
+    if not session_id:
+        return None
+    with _sessions_lock:
+        session = _sessions.get(session_id)
+        if session is not None:
+            _sessions[session_id] = session
+    return session
+
+
+def _keep_session_alive(session_id: str, session: Session) -> bool:
+    """Refresh a session's expiry time, returning False if it is no longer stored."""
+    with _sessions_lock:
+        if _sessions.get(session_id) is not session:
+            return False
+        _sessions[session_id] = session
+    return True
+
+
+def _remove_session(session_id: str) -> bool:
+    """Remove a session, returning True if it existed."""
+    with _sessions_lock:
+        return _sessions.pop(session_id, None) is not None
+
+
 def _is_initialize_request(body: Any) -> bool:
     """Check if the request is an initialization request."""
     if isinstance(body, dict):
@@ -175,97 +282,128 @@ def _is_initialize_request(body: Any) -> bool:
     return False
 
 
-async def _handle_message(server: Server, message: dict) -> dict | None:
+# Handler signature: (message, response headers) -> response
+_Handler = Callable[[dict[str, Any], dict[str, str]], Awaitable[Response]]
+
+
+def _json_response(content: bytes, headers: dict[str, str]) -> Response:
+    """Wrap an encoded JSON-RPC response body."""
+    return Response(
+        content=content,
+        status_code=200,
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+async def _do_initialize(message: dict[str, Any], headers: dict[str, str]) -> Response:
+    """Handle an initialize request."""
+    return _json_response(
+        orjson.dumps({"jsonrpc": "2.0", "id": message.get("id"), "result": _INIT_RESULT}),
+        headers,
+    )
+
+
+async def _do_initialized(message: dict[str, Any], headers: dict[str, str]) -> Response:
+    """Handle the initialized notification (no response)."""
+    return Response(status_code=202, headers=headers)
+
+
+async def _do_tools_list(message: dict[str, Any], headers: dict[str, str]) -> Response:
+    """Handle a tools/list request."""
+    return _json_response(_tools_list_response(message.get("id")), headers)
+
+
+async def _do_tools_call(message: dict[str, Any], headers: dict[str, str]) -> Response:
+    """Handle a tools/call request."""
+    params = message.get("params", {})
+    tool_name = params.get("name", "")
+    tool_args = params.get("arguments", {})
+
+    content = await get_server_manager().call_tool(tool_name, tool_args)
+    return _json_response(
+        orjson.dumps({"jsonrpc": "2.0", "id": message.get("id"), "result": {"content": content}}),
+        headers,
+    )
+
+
+async def _do_ping(message: dict[str, Any], headers: dict[str, str]) -> Response:
+    """Handle a ping request."""
+    return _json_response(_ping_response(message.get("id")), headers)
+
+
+# JSON-RPC method name -> handler
+_DISPATCH: dict[str, _Handler] = {
+    "initialize": _do_initialize,
+    "initialized": _do_initialized,
+    "tools/list": _do_tools_list,
+    "tools/call": _do_tools_call,
+    "ping": _do_ping,
+}
+
+
+def _method_not_found(msg_id: Any, method: Any) -> dict[str, Any]:
+    """Build the error response for an unknown method."""
+    return {
+        "jsonrpc": "2.0",
+        "id": msg_id,
+        "error": {
+            "code": -32601,
+            "message": f"Method not found: {method}",
+        },
+    }
+
+
+async def _handle_message(message: dict[str, Any], headers: dict[str, str]) -> Response:
     """Handle an incoming MCP message.
 
     Args:
-        server: MCP Server instance
         message: JSON-RPC message
+        headers: Headers to attach to the response
 
     Returns:
-        Response dict or None for notifications
+        HTTP response carrying the JSON-RPC reply
     """
     method = message.get("method", "")
-    params = message.get("params", {})
-    msg_id = message.get("id")
-
-    # Handle different MCP methods
-    if method == "initialize":
-        return {
-            "jsonrpc": "2.0",
-            "id": msg_id,
-            "result": {
-                "protocolVersion": "2024-11-05",
-                "serverInfo": {
-                    "name": "gl-mcp-python",
-                    "version": "0.1.0",
-                },
-                "capabilities": {
-                    "tools": {"listChanged": False},
-                },
-            },
-        }
+    # Non-string methods (e.g. lists) are unhashable and can never match
+    handler = _DISPATCH.get(method) if type(method) is str else None
+    if handler is None:
+        return _json_response(
+            orjson.dumps(_method_not_found(message.get("id"), method)), headers
+        )
+    return await handler(message, headers)
 
-    elif method == "initialized":
-        # Notification - no response
-        return None
 
-    elif method == "tools/list":
-        tools = await server.list_tools()
-        return {
-            "jsonrpc": "2.0",
-            "id": msg_id,
-            "result": {
-                "tools": [
-                    {
-                        "name": t.name,
-                        "description": t.description,
-                        "inputSchema": t.inputSchema,
-                    }
-                    for t in tools
-                ],
-            },
-        }
-
-    elif method == "tools/call":
-        tool_name = params.get("name", "")
-        tool_args = params.get("arguments", {})
-
-        result = await server.call_tool(tool_name, tool_args)
-        return {
-            "jsonrpc": "2.0",
-            "id": msg_id,
-            "result": {
-                "content": [
-                    {"type": c.type, "text": c.text}
-                    for c in result
-                ],
-            },
-        }
-
-    elif method == "ping":
-        return {
-            "jsonrpc": "2.0",
-            "id": msg_id,
-            "result": {},
-        }
-
-    else:
-        return {
-            "jsonrpc": "2.0",
-            "id": msg_id,
-            "error": {
-                "code": -32601,
-                "message": f"Method not found: {method}",
-            },
-        }
+def _encode_id(msg_id: Any) -> bytes:
+    """Encode a JSON-RPC request id for splicing into a pre-serialized response."""
+    return str(msg_id).encode() if type(msg_id) is int else orjson.dumps(msg_id)
+
+
+def _ping_response(msg_id: Any) -> bytes:
+    """Build a ping response body from the pre-serialized template."""
+    return _PING_TEMPLATE.replace(b"__ID__", _encode_id(msg_id))
+
+
+def _tools_list_response(msg_id: Any) -> bytes:
+    """Build a tools/list response body around the pre-serialized result."""
+    return b"".join((
+        b'{"jsonrpc":"2.0","id":',
+        _encode_id(msg_id),
+        b',"result":',
+        get_server_manager().tools_list_encoded,
+        b"}",
+    ))
 
 
 def get_session_count() -> int:
     """Get the number of active MCP sessions."""
-    return len(_sessions)
+    with _sessions_lock:
+        _sessions.expire()
+        return len(_sessions)
 
 
 def get_session_ids() -> list[str]:
     """Get list of active session IDs."""
-    return list(_sessions.keys())
+    with _sessions_lock:
+        _sessions.expire()
+        return list(_sessions.keys())
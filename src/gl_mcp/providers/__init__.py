@@ -5,6 +5,7 @@ from gl_mcp.providers.base import (
     ProviderRegistry,
     get_provider_registry,
     initialize_providers,
+    shutdown_providers,
 )
 from gl_mcp.providers.jira import JiraProvider
 
@@ -13,6 +14,7 @@ __all__ = [
     "ProviderRegistry",
     "get_provider_registry",
     "initialize_providers",
+    "shutdown_providers",
     "JiraProvider",
 ]
 
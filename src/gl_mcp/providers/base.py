@@ -1,9 +1,13 @@
 """Base provider class for MCP tool providers."""
 
+import asyncio
 import logging
+import types
 from abc import ABC, abstractmethod
-from typing import Any, Callable
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any
 
+from gl_mcp._lazy import Lazy
 from gl_mcp.mcp.server import get_server_manager
 
 logger = logging.getLogger(__name__)
@@ -23,6 +27,7 @@ class BaseProvider(ABC):
     def __init__(self):
         self._credentials_loaded = False
         self._credentials_valid = False
+        self._tool_names: list[str] = []
 
     @abstractmethod
     async def load_credentials(self) -> bool:
@@ -42,8 +47,8 @@ class BaseProvider(ABC):
         self,
         name: str,
         description: str,
-        input_schema: dict,
-        handler: Callable,
+        input_schema: dict[str, Any],
+        handler: Callable[..., Awaitable[Any]],
     ) -> None:
         """Helper method to register a tool.
 
@@ -60,6 +65,7 @@ class BaseProvider(ABC):
             input_schema=input_schema,
             handler=handler,
         )
+        self._tool_names.append(full_name)
 
     async def initialize(self) -> bool:
         """Initialize the provider (load credentials and register tools).
@@ -81,6 +87,23 @@ class BaseProvider(ABC):
 
         return self._credentials_valid
 
+    async def close(self) -> None:
+        """Release resources held by the provider (e.g., HTTP clients)."""
+        pass
+
+    def mark_unavailable(self) -> None:
+        """Mark the provider unavailable after it was initialized (e.g., credentials revoked).
+
+        Withdraws the provider's registered tools so they are no longer listed.
+        """
+        self._credentials_valid = False
+        manager = get_server_manager()
+        for name in self._tool_names:
+            manager.unregister_tool(name)
+        self._tool_names.clear()
+        get_provider_registry().refresh_status()
+        logger.warning(f"Provider '{self.name}' marked unavailable")
+
     @property
     def is_available(self) -> bool:
         """Check if provider is available (credentials valid)."""
@@ -92,12 +115,20 @@ class ProviderRegistry:
 
     def __init__(self):
         self._providers: dict[str, BaseProvider] = {}
+        self._snapshot: Mapping[str, bool] = types.MappingProxyType({})
 
     def register(self, provider: BaseProvider) -> None:
         """Register a provider."""
         self._providers[provider.name] = provider
+        self.refresh_status()
         logger.debug(f"Registered provider: {provider.name}")
 
+    def refresh_status(self) -> None:
+        """Publish a read-only snapshot of provider availability."""
+        self._snapshot = types.MappingProxyType(
+            {name: provider.is_available for name, provider in self._providers.items()}
+        )
+
     async def initialize_all(self, user_roles: list[str] | None = None) -> dict[str, bool]:
         """Initialize all registered providers.
 
@@ -108,6 +139,7 @@ class ProviderRegistry:
             Dict of provider name -> initialization status
         """
         results = {}
+        eligible: list[tuple[str, BaseProvider]] = []
         for name, provider in self._providers.items():
             # Check role requirements
             if provider.required_role and user_roles is not None:
@@ -118,10 +150,31 @@ class ProviderRegistry:
                     results[name] = False
                     continue
 
-            results[name] = await provider.initialize()
+            results[name] = False
+            eligible.append((name, provider))
 
+        # Credential checks are independent I/O, so run them concurrently
+        statuses = await asyncio.gather(
+            *(provider.initialize() for _, provider in eligible),
+            return_exceptions=True,
+        )
+        for (name, _), status in zip(eligible, statuses):
+            if isinstance(status, BaseException):
+                logger.error(f"Provider '{name}' initialization failed", exc_info=status)
+                status = False
+            results[name] = status
+
+        self.refresh_status()
         return results
 
+    async def close_all(self) -> None:
+        """Close all registered providers."""
+        for name, provider in self._providers.items():
+            try:
+                await provider.close()
+            except Exception:
+                logger.exception(f"Error closing provider '{name}'")
+
     def get_provider(self, name: str) -> BaseProvider | None:
         """Get a provider by name."""
         return self._providers.get(name)
@@ -144,25 +197,25 @@ class ProviderRegistry:
                 available.append(name)
         return available
 
-    async def check_all_credentials(self) -> dict[str, bool]:
+    def check_all_credentials(self) -> Mapping[str, bool]:
         """Check credentials for all providers.
 
+        Served from the snapshot refreshed at registration, at initialization
+        and when a provider is marked unavailable.
+
         Returns:
-            Dict of provider name -> credential status
+            Read-only mapping of provider name -> credential status
         """
-        return {name: provider.is_available for name, provider in self._providers.items()}
+        return self._snapshot
 
 
 # Global provider registry
-_registry: ProviderRegistry | None = None
+_registry: Lazy[ProviderRegistry] = Lazy(ProviderRegistry)
 
 
 def get_provider_registry() -> ProviderRegistry:
     """Get or create the global provider registry."""
-    global _registry
-    if _registry is None:
-        _registry = ProviderRegistry()
-    return _registry
+    return _registry.get()
 
 
 async def initialize_providers(user_roles: list[str] | None = None) -> dict[str, bool]:
@@ -175,3 +228,8 @@ async def initialize_providers(user_roles: list[str] | None = None) -> dict[str,
         Dict of provider name -> initialization status
     """
     return await get_provider_registry().initialize_all(user_roles)
+
+
+async def shutdown_providers() -> None:
+    """Close all registered providers."""
+    await get_provider_registry().close_all()
@@ -1,15 +1,185 @@
 """JIRA provider for MCP tools."""
 
+import asyncio
 import logging
+import re
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
 import httpx
+import ijson  # type: ignore[import-untyped]
+import orjson
 
 from gl_mcp.config import get_settings
 from gl_mcp.providers.base import BaseProvider
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on in-flight JIRA API requests per provider
+_MAX_CONCURRENT_REQUESTS = 10
+
+# Fixed endpoints, parsed once and joined onto the client's base_url
+_URL_MYSELF = httpx.URL("/rest/api/3/myself")
+_URL_SEARCH = httpx.URL("/rest/api/3/search/jql")
+_URL_CREATE = httpx.URL("/rest/api/3/issue")
+
+# Fields read by search_issues
+_SEARCH_FIELDS = ["summary", "status"]
+
+# Response formatting templates
+_SEARCH_LINE_TEMPLATE = "- {key}: {summary} [{status}]"
+_ISSUE_TEMPLATE = (
+    "**{key}: {summary}**\n"
+    "\n"
+    "**Type:** {issue_type}\n"
+    "**Status:** {status}\n"
+    "**Priority:** {priority}\n"
+    "\n"
+    "**Description:**\n"
+    "{description}\n"
+)
+
+# get_issue lookups arriving within this window (seconds) share one search
+_ISSUE_BATCH_DELAY = 0.005
+_ISSUE_FIELDS = ["summary", "status", "priority", "issuetype", "description"]
+_ISSUE_KEY_RE = re.compile(r"[A-Z][A-Z0-9_]*-[0-9]+")
+
+# Issues fetched individually are kept with their ETag for conditional GETs (LRU)
+_ISSUE_CACHE_SIZE = 128
+
+# Transition name -> id mappings are cached per issue
+_TRANSITION_CACHE_TTL = 300.0
+_TRANSITION_CACHE_SIZE = 256
+
+# Tool input schemas, built once at import and shared by all provider instances
+_SEARCH_ISSUES_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "jql": {
+            "type": "string",
+            "description": "JQL query string (e.g., 'project = GL AND status = \"To Do\"')",
+        },
+        "max_results": {
+            "type": "integer",
+            "description": "Maximum number of results (default: 20)",
+            "default": 20,
+        },
+    },
+    "required": ["jql"],
+}
+
+_GET_ISSUE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "issue_key": {
+            "type": "string",
+            "description": "Issue key (e.g., 'GL-123')",
+        },
+    },
+    "required": ["issue_key"],
+}
+
+_CREATE_ISSUE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "project": {
+            "type": "string",
+            "description": "Project key (e.g., 'GL')",
+        },
+        "summary": {
+            "type": "string",
+            "description": "Issue summary/title",
+        },
+        "description": {
+            "type": "string",
+            "description": "Issue description (plain text)",
+        },
+        "issue_type": {
+            "type": "string",
+            "description": "Issue type (e.g., 'Task', 'Bug')",
+            "default": "Task",
+        },
+    },
+    "required": ["project", "summary"],
+}
+
+_ADD_COMMENT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "issue_key": {
+            "type": "string",
+            "description": "Issue key (e.g., 'GL-123')",
+        },
+        "comment": {
+            "type": "string",
+            "description": "Comment text",
+        },
+    },
+    "required": ["issue_key", "comment"],
+}
+
+_TRANSITION_ISSUE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "issue_key": {
+            "type": "string",
+            "description": "Issue key (e.g., 'GL-123')",
+        },
+        "transition_name": {
+            "type": "string",
+            "description": "Transition name (e.g., 'Done', 'In Progress')",
+        },
+    },
+    "required": ["issue_key", "transition_name"],
+}
+
+
+def _adf(text: str) -> dict[str, Any]:
+    """Wrap plain text in a single-paragraph Atlassian Document Format document."""
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [
+            {
+                "type": "paragraph",
+                "content": [{"type": "text", "text": text}] if text else [],
+            }
+        ],
+    }
+
+
+# Pre-serialized empty document, embedded as-is by orjson
+_EMPTY_ADF = orjson.Fragment(orjson.dumps(_adf("")))
+
+
+class _AsyncByteReader:
+    """Async file-like adapter over a byte-chunk iterator, as consumed by ijson."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks
+
+    async def read(self, size: int = -1) -> bytes:
+        if size == 0:
+            return b""
+        return await anext(self._chunks, b"")
+
+
+def _resolve(
+    futures: list[asyncio.Future[dict[str, Any]]],
+    outcome: dict[str, Any] | Exception,
+) -> None:
+    """Complete pending lookups that are still being awaited with a result or error."""
+    for future in futures:
+        if future.done():
+            continue
+        if isinstance(outcome, Exception):
+            future.set_exception(outcome)
+        else:
+            future.set_result(outcome)
+
 
 class JiraProvider(BaseProvider):
     """Provider for JIRA integration tools."""
@@ -19,189 +189,243 @@ class JiraProvider(BaseProvider):
 
     def __init__(self):
         super().__init__()
+        settings = get_settings()
+        self._cfg = (settings.jira_url, settings.jira_username, settings.jira_api_token)
+        self._verify_on_startup = settings.jira_verify_on_startup
+        self._verify_task: asyncio.Task[bool] | None = None
+        self._auth_rejected = False
         self._client: httpx.AsyncClient | None = None
         self._base_url: str = ""
         self._auth: tuple[str, str] | None = None
+        self._transition_cache: dict[str, tuple[float, dict[str, str]]] = {}
+        self._semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+        self._pending_issues: dict[str, list[asyncio.Future[dict[str, Any]]]] = {}
+        self._issue_batch_task: asyncio.Task[None] | None = None
+        self._issue_cache: OrderedDict[str, tuple[str, dict[str, Any]]] = OrderedDict()
 
     async def load_credentials(self) -> bool:
-        """Load JIRA credentials from settings."""
-        settings = get_settings()
+        """Load JIRA credentials from settings.
+
+        The connectivity check runs in the background unless
+        JIRA_VERIFY_ON_STARTUP is set, so startup does not wait on JIRA.
+        With JIRA_VERIFY_ON_STARTUP, any failed check (including network
+        errors) leaves the provider disabled. In the background, only a
+        credential rejection (401) disables it and withdraws its tools;
+        other failures are logged and the tools stay available.
+        """
+        if not self.configure():
+            return False
+
+        if self._verify_on_startup:
+            return await self.verify()
+
+        logger.info("JIRA configured; verifying credentials in the background")
+        self._verify_task = asyncio.create_task(self.verify())
+        return True
+
+    def configure(self) -> bool:
+        """Create the shared HTTP client from settings.
 
-        if not settings.jira_url or not settings.jira_username or not settings.jira_api_token:
+        Returns:
+            True if JIRA credentials are configured
+        """
+        url, username, api_token = self._cfg
+
+        if not url or not username or not api_token:
             logger.warning("JIRA credentials not configured")
             return False
 
-        self._base_url = settings.jira_url.rstrip("/")
-        self._auth = (settings.jira_username, settings.jira_api_token)
+        self._base_url = url.rstrip("/")
+        self._auth = (username, api_token)
+        self._client = httpx.AsyncClient(
+            base_url=self._base_url,
+            auth=self._auth,
+            headers={"Accept": "application/json", "Content-Type": "application/json"},
+            timeout=httpx.Timeout(30.0, connect=10.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=50,
+                keepalive_expiry=60.0,
+            ),
+            http2=True,
+        )
+        return True
+
+    async def verify(self) -> bool:
+        """Check the configured credentials against JIRA.
 
-        # Test connection
+        Returns:
+            True if JIRA accepted the credentials
+        """
+        # Test connection (also warms the connection pool)
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self._base_url}/rest/api/3/myself",
-                    auth=self._auth,
-                    timeout=10.0,
-                )
-                if response.status_code == 200:
-                    user = response.json()
-                    logger.info(f"JIRA connected as: {user.get('displayName', 'unknown')}")
-                    return True
-                else:
-                    logger.warning(f"JIRA auth failed: {response.status_code}")
-                    return False
+            response = await self._http().get(_URL_MYSELF)
+            if response.status_code == 200:
+                user = orjson.loads(response.content)
+                logger.info(f"JIRA connected as: {user.get('displayName', 'unknown')}")
+                return True
+            else:
+                logger.warning(f"JIRA auth failed: {response.status_code}")
+                if response.status_code == 401:
+                    self._reject_credentials()
+                return False
         except Exception as e:
             logger.exception(f"JIRA connection error: {e}")
             return False
 
+    def _reject_credentials(self) -> None:
+        """Disable the provider after JIRA rejected its credentials."""
+        if not self._auth_rejected:
+            self._auth_rejected = True
+            logger.error(
+                "JIRA rejected the configured credentials (401); "
+                "check JIRA_USERNAME and JIRA_API_TOKEN. Disabling the JIRA provider."
+            )
+            self.mark_unavailable()
+
+    async def close(self) -> None:
+        """Close the shared HTTP client."""
+        if self._verify_task is not None:
+            self._verify_task.cancel()
+            self._verify_task = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     def register_tools(self) -> None:
         """Register JIRA tools."""
         self.register_tool(
             name="search_issues",
             description="Search JIRA issues using JQL query",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "jql": {
-                        "type": "string",
-                        "description": "JQL query string (e.g., 'project = GL AND status = \"To Do\"')",
-                    },
-                    "max_results": {
-                        "type": "integer",
-                        "description": "Maximum number of results (default: 20)",
-                        "default": 20,
-                    },
-                },
-                "required": ["jql"],
-            },
+            input_schema=_SEARCH_ISSUES_SCHEMA,
             handler=self._search_issues,
         )
 
         self.register_tool(
             name="get_issue",
             description="Get details of a specific JIRA issue",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "issue_key": {
-                        "type": "string",
-                        "description": "Issue key (e.g., 'GL-123')",
-                    },
-                },
-                "required": ["issue_key"],
-            },
+            input_schema=_GET_ISSUE_SCHEMA,
             handler=self._get_issue,
         )
 
         self.register_tool(
             name="create_issue",
             description="Create a new JIRA issue",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "project": {
-                        "type": "string",
-                        "description": "Project key (e.g., 'GL')",
-                    },
-                    "summary": {
-                        "type": "string",
-                        "description": "Issue summary/title",
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "Issue description (plain text)",
-                    },
-                    "issue_type": {
-                        "type": "string",
-                        "description": "Issue type (e.g., 'Task', 'Bug')",
-                        "default": "Task",
-                    },
-                },
-                "required": ["project", "summary"],
-            },
+            input_schema=_CREATE_ISSUE_SCHEMA,
             handler=self._create_issue,
         )
 
         self.register_tool(
             name="add_comment",
             description="Add a comment to a JIRA issue",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "issue_key": {
-                        "type": "string",
-                        "description": "Issue key (e.g., 'GL-123')",
-                    },
-                    "comment": {
-                        "type": "string",
-                        "description": "Comment text",
-                    },
-                },
-                "required": ["issue_key", "comment"],
-            },
+            input_schema=_ADD_COMMENT_SCHEMA,
             handler=self._add_comment,
         )
 
         self.register_tool(
             name="transition_issue",
             description="Transition a JIRA issue to a new status",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "issue_key": {
-                        "type": "string",
-                        "description": "Issue key (e.g., 'GL-123')",
-                    },
-                    "transition_name": {
-                        "type": "string",
-                        "description": "Transition name (e.g., 'Done', 'In Progress')",
-                    },
-                },
-                "required": ["issue_key", "transition_name"],
-            },
+            input_schema=_TRANSITION_ISSUE_SCHEMA,
             handler=self._transition_issue,
         )
 
+    async def _send(
+        self,
+        method: str,
+        endpoint: str | httpx.URL,
+        json_data: dict[str, Any] | None = None,
+        extra_headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """Send an authenticated request to JIRA API and return the raw response."""
+        self._check_enabled()
+        content = orjson.dumps(json_data) if json_data is not None else None
+        async with self._semaphore:
+            response = await self._http().request(
+                method, endpoint, content=content, headers=extra_headers
+            )
+        logger.debug(f"JIRA {method} {endpoint}: {response.status_code} ({response.http_version})")
+        if response.status_code == 401:
+            self._reject_credentials()
+        return response
+
+    def _http(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, which exists once configure() has run."""
+        if self._client is None:
+            raise RuntimeError("JIRA provider is not configured")
+        return self._client
+
+    def _check_enabled(self) -> None:
+        """Refuse to call JIRA once the credentials have been rejected."""
+        if self._auth_rejected:
+            raise PermissionError(
+                "JIRA provider disabled: the configured credentials were rejected"
+            )
+
     async def _request(
-        self, method: str, endpoint: str, json_data: dict | None = None
+        self,
+        method: str,
+        endpoint: str | httpx.URL,
+        json_data: dict[str, Any] | None = None,
+        extra_headers: dict[str, str] | None = None,
     ) -> dict[str, Any]:
         """Make an authenticated request to JIRA API."""
-        async with httpx.AsyncClient() as client:
-            response = await client.request(
-                method=method,
-                url=f"{self._base_url}{endpoint}",
-                auth=self._auth,
-                json=json_data,
-                headers={"Accept": "application/json", "Content-Type": "application/json"},
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            return response.json() if response.content else {}
+        response = await self._send(method, endpoint, json_data, extra_headers)
+        response.raise_for_status()
+        # 204s and other empty replies skip the parser entirely
+        if response.headers.get("content-length") == "0":
+            return {}
+        content = response.content
+        return orjson.loads(content) if content else {}
+
+    async def _request_no_body(
+        self, method: str, endpoint: str | httpx.URL, json_data: dict[str, Any] | None = None
+    ) -> None:
+        """Make an authenticated request to JIRA API whose response body is not needed."""
+        response = await self._send(method, endpoint, json_data)
+        response.raise_for_status()
+
+    @asynccontextmanager
+    async def _request_stream(
+        self, method: str, endpoint: str | httpx.URL, json_data: dict[str, Any] | None = None
+    ) -> AsyncIterator[httpx.Response]:
+        """Make an authenticated request to JIRA API without buffering the response body."""
+        self._check_enabled()
+        content = orjson.dumps(json_data) if json_data is not None else None
+        async with self._semaphore:
+            async with self._http().stream(method, endpoint, content=content) as response:
+                logger.debug(
+                    f"JIRA {method} {endpoint}: {response.status_code} ({response.http_version})"
+                )
+                if response.status_code == 401:
+                    self._reject_credentials()
+                response.raise_for_status()
+                yield response
 
     async def _search_issues(self, jql: str, max_results: int = 20) -> str:
         """Search JIRA issues."""
-        result = await self._request(
+        lines = []
+        async with self._request_stream(
             "POST",
-            "/rest/api/3/search/jql",
-            {"jql": jql, "maxResults": max_results, "fields": ["key", "summary", "status", "priority", "created"]},
-        )
-
-        issues = result.get("issues", [])
-        if not issues:
+            _URL_SEARCH,
+            {"jql": jql, "maxResults": max_results, "fields": _SEARCH_FIELDS},
+        ) as response:
+            # Format each issue as it is parsed instead of holding the whole result
+            reader = _AsyncByteReader(response.aiter_bytes())
+            async for issue in ijson.items(reader, "issues.item"):
+                key = issue["key"]
+                fields = issue["fields"]
+                summary = fields.get("summary", "No summary")
+                status = fields.get("status", {}).get("name", "Unknown")
+                lines.append(_SEARCH_LINE_TEMPLATE.format(key=key, summary=summary, status=status))
+
+        if not lines:
             return "No issues found matching the query."
 
-        lines = [f"Found {len(issues)} issues:\n"]
-        for issue in issues:
-            key = issue["key"]
-            fields = issue["fields"]
-            summary = fields.get("summary", "No summary")
-            status = fields.get("status", {}).get("name", "Unknown")
-            lines.append(f"- {key}: {summary} [{status}]")
-
-        return "\n".join(lines)
+        return f"Found {len(lines)} issues:\n\n" + "\n".join(lines)
 
     async def _get_issue(self, issue_key: str) -> str:
         """Get a specific JIRA issue."""
-        result = await self._request("GET", f"/rest/api/3/issue/{issue_key}")
+        result = await self._fetch_issue(issue_key)
 
         fields = result.get("fields", {})
         summary = fields.get("summary", "No summary")
@@ -215,15 +439,91 @@ class JiraProvider(BaseProvider):
         if desc_content and isinstance(desc_content, dict):
             description = self._extract_text_from_adf(desc_content)
 
-        return f"""**{issue_key}: {summary}**
-
-**Type:** {issue_type}
-**Status:** {status}
-**Priority:** {priority}
-
-**Description:**
-{description}
-"""
+        return _ISSUE_TEMPLATE.format_map({
+            "key": issue_key,
+            "summary": summary,
+            "issue_type": issue_type,
+            "status": status,
+            "priority": priority,
+            "description": description,
+        })
+
+    async def _fetch_issue(self, issue_key: str) -> dict[str, Any]:
+        """Fetch an issue, coalescing lookups made within a short window into one search."""
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        self._pending_issues.setdefault(issue_key, []).append(future)
+        if self._issue_batch_task is None:
+            self._issue_batch_task = asyncio.create_task(self._flush_issue_batch())
+        return await future
+
+    async def _flush_issue_batch(self) -> None:
+        """Resolve all pending issue lookups."""
+        await asyncio.sleep(_ISSUE_BATCH_DELAY)
+        pending, self._pending_issues = self._pending_issues, {}
+        self._issue_batch_task = None
+
+        # Only well-formed keys are safe to splice into JQL
+        batchable = [key for key in pending if _ISSUE_KEY_RE.fullmatch(key)]
+        found: dict[str, dict[str, Any]] = {}
+        if len(batchable) > 1:
+            try:
+                result = await self._request(
+                    "POST",
+                    _URL_SEARCH,
+                    {
+                        "jql": f"key in ({','.join(batchable)})",
+                        "maxResults": len(batchable),
+                        "fields": _ISSUE_FIELDS,
+                    },
+                )
+                found = {issue["key"]: issue for issue in result.get("issues", [])}
+            except Exception:
+                logger.warning("Batched JIRA issue lookup failed; fetching individually")
+
+        # Anything the search did not return is fetched on its own
+        missing = []
+        for key, futures in pending.items():
+            issue = found.get(key)
+            if issue is None:
+                missing.append(self._fetch_issue_directly(key, futures))
+            else:
+                _resolve(futures, issue)
+        await asyncio.gather(*missing)
+
+    async def _fetch_issue_directly(
+        self, issue_key: str, futures: list[asyncio.Future[dict[str, Any]]]
+    ) -> None:
+        """Fetch a single issue and resolve its pending lookups."""
+        try:
+            issue = await self._get_issue_conditional(issue_key)
+        except Exception as e:
+            _resolve(futures, e)
+        else:
+            _resolve(futures, issue)
+
+    async def _get_issue_conditional(self, issue_key: str) -> dict[str, Any]:
+        """GET an issue, revalidating a cached copy with its ETag."""
+        cache = self._issue_cache
+        cached = cache.get(issue_key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+
+        response = await self._send("GET", f"/rest/api/3/issue/{issue_key}", extra_headers=headers)
+        if response.status_code == 304 and cached:
+            cache.move_to_end(issue_key)
+            return cached[1]
+
+        response.raise_for_status()
+        issue = orjson.loads(response.content) if response.content else {}
+
+        etag = response.headers.get("ETag")
+        if etag:
+            cache[issue_key] = (etag, issue)
+            cache.move_to_end(issue_key)
+            if len(cache) > _ISSUE_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.pop(issue_key, None)
+        return issue
 
     async def _create_issue(
         self,
@@ -233,21 +533,11 @@ class JiraProvider(BaseProvider):
         issue_type: str = "Task",
     ) -> str:
         """Create a new JIRA issue."""
-        # Build ADF description
-        adf_description = {
-            "type": "doc",
-            "version": 1,
-            "content": [
-                {
-                    "type": "paragraph",
-                    "content": [{"type": "text", "text": description}] if description else [],
-                }
-            ],
-        }
+        adf_description = _adf(description) if description else _EMPTY_ADF
 
         result = await self._request(
             "POST",
-            "/rest/api/3/issue",
+            _URL_CREATE,
             {
                 "fields": {
                     "project": {"key": project},
@@ -263,60 +553,85 @@ class JiraProvider(BaseProvider):
 
     async def _add_comment(self, issue_key: str, comment: str) -> str:
         """Add a comment to a JIRA issue."""
-        adf_body = {
-            "type": "doc",
-            "version": 1,
-            "content": [
-                {"type": "paragraph", "content": [{"type": "text", "text": comment}]}
-            ],
-        }
-
-        await self._request(
+        await self._request_no_body(
             "POST",
             f"/rest/api/3/issue/{issue_key}/comment",
-            {"body": adf_body},
+            {"body": _adf(comment)},
         )
 
         return f"Added comment to {issue_key}"
 
     async def _transition_issue(self, issue_key: str, transition_name: str) -> str:
         """Transition a JIRA issue."""
+        target = transition_name.lower()
+
+        # Try a cached transition id first; the cache holds an issue's transitions
+        # only until one is applied, since they depend on its current status
+        cached = self._transition_cache.get(issue_key)
+        if cached and cached[0] > time.monotonic():
+            transition_id = cached[1].get(target)
+            if transition_id is not None:
+                try:
+                    await self._post_transition(issue_key, transition_id)
+                    return f"Transitioned {issue_key} to '{transition_name}'"
+                except httpx.HTTPStatusError as e:
+                    if e.response.status_code not in (400, 404):
+                        raise
+                    # Not valid from the current status; refetch below
+                    self._transition_cache.pop(issue_key, None)
+
         # Get available transitions
         result = await self._request("GET", f"/rest/api/3/issue/{issue_key}/transitions")
 
         transitions = result.get("transitions", [])
-        transition_id = None
+        mapping = {t["name"].lower(): t["id"] for t in transitions}
+        self._cache_transitions(issue_key, mapping)
+        transition_id = mapping.get(target)
 
-        for t in transitions:
-            if t["name"].lower() == transition_name.lower():
-                transition_id = t["id"]
-                break
+        if transition_id is None:
+            available = ", ".join(t["name"] for t in transitions)
+            return f"Transition '{transition_name}' not found. Available: {available}"
 
-        if not transition_id:
-            available = [t["name"] for t in transitions]
-            return f"Transition '{transition_name}' not found. Available: {', '.join(available)}"
+        await self._post_transition(issue_key, transition_id)
+
+        return f"Transitioned {issue_key} to '{transition_name}'"
 
-        await self._request(
+    async def _post_transition(self, issue_key: str, transition_id: str) -> None:
+        """Apply a transition to an issue and forget its cached transitions."""
+        await self._request_no_body(
             "POST",
             f"/rest/api/3/issue/{issue_key}/transitions",
             {"transition": {"id": transition_id}},
         )
-
-        return f"Transitioned {issue_key} to '{transition_name}'"
-
-    def _extract_text_from_adf(self, adf: dict) -> str:
+        self._transition_cache.pop(issue_key, None)
+
+    def _cache_transitions(self, issue_key: str, mapping: dict[str, str]) -> None:
+        """Cache an issue's transition name -> id mapping."""
+        cache = self._transition_cache
+        now = time.monotonic()
+        if len(cache) >= _TRANSITION_CACHE_SIZE:
+            for key in [k for k, (expires, _) in cache.items() if expires <= now]:
+                del cache[key]
+            if len(cache) >= _TRANSITION_CACHE_SIZE:
+                del cache[next(iter(cache))]
+        cache[issue_key] = (now + _TRANSITION_CACHE_TTL, mapping)
+
+    def _extract_text_from_adf(self, adf: dict[str, Any]) -> str:
         """Extract plain text from Atlassian Document Format."""
-        texts = []
-
-        def extract(node):
-            if isinstance(node, dict):
+        texts: list[str] = []
+        stack: list[Any] = [adf]
+
+        # Iterative depth-first walk; children are pushed in reverse to keep text order
+        while stack:
+            node = stack.pop()
+            node_type = type(node)
+            if node_type is dict:
                 if node.get("type") == "text":
                     texts.append(node.get("text", ""))
-                for child in node.get("content", []):
-                    extract(child)
-            elif isinstance(node, list):
-                for item in node:
-                    extract(item)
+                content = node.get("content")
+                if content:
+                    stack.append(content)
+            elif node_type is list:
+                stack.extend(reversed(node))
 
-        extract(adf)
         return " ".join(texts) if texts else "No description"
@@ -0,0 +1,33 @@
+"""Shared test fixtures."""
+
+from collections.abc import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+from gl_mcp.main import app
+
+
+@pytest.fixture(scope="session")
+def client() -> Iterator[TestClient]:
+    """Test client with the app lifespan run once for the whole session."""
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def session_id(client: TestClient) -> str:
+    """MCP session ID from a single initialize request."""
+    response = client.post(
+        "/mcp",
+        json={
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "initialize",
+            "params": {
+                "protocolVersion": "2024-11-05",
+                "clientInfo": {"name": "test-client", "version": "1.0.0"},
+            },
+        },
+    )
+    return response.headers["mcp-session-id"]
@@ -0,0 +1,65 @@
+"""Tests for settings loading."""
+
+from pathlib import Path
+
+import pytest
+
+from gl_mcp.config import _load
+
+
+@pytest.fixture
+def env_file(tmp_path: Path) -> Path:
+    """Path for a throwaway .env file."""
+    return tmp_path / ".env"
+
+
+def test_environment_overrides_env_file(env_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test environment variables take precedence over the .env file."""
+    env_file.write_text("PORT=4000\nLOG_LEVEL=debug\n")
+    monkeypatch.setenv("PORT", "5000")
+    monkeypatch.delenv("LOG_LEVEL", raising=False)
+
+    settings = _load(str(env_file))
+
+    assert settings.port == 5000
+    assert settings.log_level == "debug"
+
+
+def test_keys_are_case_insensitive(env_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test variable names match settings regardless of case."""
+    env_file.write_text("jira_url=https://jira.example.com\n")
+    monkeypatch.delenv("JIRA_URL", raising=False)
+    monkeypatch.setenv("Jira_Username", "someone")
+
+    settings = _load(str(env_file))
+
+    assert settings.jira_url == "https://jira.example.com"
+    assert settings.jira_username == "someone"
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [("true", True), ("1", True), ("yes", True), ("On", True), ("no", False), ("off", False)],
+)
+def test_bool_spellings(
+    env_file: Path, monkeypatch: pytest.MonkeyPatch, raw: str, expected: bool
+) -> None:
+    """Test the boolean spellings pydantic-settings accepted are still accepted."""
+    monkeypatch.setenv("AUTH_ENABLED", raw)
+
+    assert _load(str(env_file)).auth_enabled is expected
+
+
+def test_numbers_are_coerced(env_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test numeric settings are converted from their string values."""
+    monkeypatch.setenv("MAX_SESSIONS", "25")
+
+    assert _load(str(env_file)).max_sessions == 25
+
+
+def test_invalid_value_names_variable(env_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a value of the wrong type raises an error naming the variable."""
+    monkeypatch.setenv("PORT", "not-a-port")
+
+    with pytest.raises(ValueError, match="PORT"):
+        _load(str(env_file))
@@ -1,13 +1,13 @@
 """Tests for health check endpoint."""
 
+import pytest
 from fastapi.testclient import TestClient
 
-from gl_mcp.main import app
+from gl_mcp.mcp import transport
+from gl_mcp.mcp.server import MCPServerManager, get_server_manager
 
-client = TestClient(app)
 
-
-def test_health_check() -> None:
+def test_health_check(client: TestClient) -> None:
     """Test health check returns healthy status."""
     response = client.get("/health")
     assert response.status_code == 200
@@ -19,7 +19,7 @@ def test_health_check() -> None:
     assert "sessions" in data
 
 
-def test_root() -> None:
+def test_root(client: TestClient) -> None:
     """Test root endpoint returns service info."""
     response = client.get("/")
     assert response.status_code == 200
@@ -28,7 +28,7 @@ def test_root() -> None:
     assert data["docs"] == "/docs"
 
 
-def test_mcp_initialize() -> None:
+def test_mcp_initialize(client: TestClient) -> None:
     """Test MCP initialization request."""
     response = client.post(
         "/mcp",
@@ -51,35 +51,94 @@ def test_mcp_initialize() -> None:
     assert "mcp-session-id" in response.headers
 
 
-def test_mcp_list_tools() -> None:
+def test_mcp_list_tools(client: TestClient, session_id: str) -> None:
     """Test MCP tools/list request."""
-    # First initialize to get session
-    init_response = client.post(
+    response = client.post(
         "/mcp",
+        headers={"mcp-session-id": session_id},
         json={
             "jsonrpc": "2.0",
-            "id": 1,
-            "method": "initialize",
-            "params": {
-                "protocolVersion": "2024-11-05",
-                "clientInfo": {"name": "test-client", "version": "1.0.0"},
-            },
+            "id": 2,
+            "method": "tools/list",
+            "params": {},
         },
     )
-    session_id = init_response.headers.get("mcp-session-id")
+    assert response.status_code == 200
+    data = response.json()
+    assert "result" in data
+    assert "tools" in data["result"]
+
+
+def test_mcp_ping(client: TestClient, session_id: str) -> None:
+    """Test MCP ping request echoes the request id."""
+    response = client.post(
+        "/mcp",
+        headers={"mcp-session-id": session_id},
+        json={"jsonrpc": "2.0", "id": "ping-1", "method": "ping"},
+    )
+    assert response.status_code == 200
+    assert response.json() == {"jsonrpc": "2.0", "id": "ping-1", "result": {}}
+
+
+@pytest.fixture
+def echo_tool_manager(monkeypatch: pytest.MonkeyPatch) -> MCPServerManager:
+    """Serve tools/call from a fresh manager with a test_echo tool.
+
+    Keeps the tool out of the process-global manager shared by other tests.
+    """
+
+    async def echo(text: str) -> str:
+        return text
+
+    manager = MCPServerManager()
+    manager.register_tool(
+        name="test_echo",
+        description="Echo the input text",
+        input_schema={"type": "object", "properties": {"text": {"type": "string"}}},
+        handler=echo,
+    )
+    monkeypatch.setattr(transport, "get_server_manager", lambda: manager)
+    return manager
+
 
-    # List tools
+def test_mcp_call_tool(
+    client: TestClient, session_id: str, echo_tool_manager: MCPServerManager
+) -> None:
+    """Test MCP tools/call returns handler output as text content."""
     response = client.post(
         "/mcp",
         headers={"mcp-session-id": session_id},
         json={
             "jsonrpc": "2.0",
-            "id": 2,
-            "method": "tools/list",
-            "params": {},
+            "id": 3,
+            "method": "tools/call",
+            "params": {"name": "test_echo", "arguments": {"text": "hello"}},
         },
     )
     assert response.status_code == 200
     data = response.json()
-    assert "result" in data
-    assert "tools" in data["result"]
+    assert data["result"]["content"] == [{"type": "text", "text": "hello"}]
+    assert "test_echo" not in get_server_manager().tool_names
+
+
+def test_mcp_list_tools_uses_current_manager(
+    client: TestClient, session_id: str, echo_tool_manager: MCPServerManager
+) -> None:
+    """Test tools/list is served from the active manager, not a stale encoding."""
+    response = client.post(
+        "/mcp",
+        headers={"mcp-session-id": session_id},
+        json={"jsonrpc": "2.0", "id": 5, "method": "tools/list"},
+    )
+    assert [tool["name"] for tool in response.json()["result"]["tools"]] == ["test_echo"]
+
+
+def test_mcp_non_string_method(client: TestClient, session_id: str) -> None:
+    """Test a non-string method is reported as not found rather than failing."""
+    response = client.post(
+        "/mcp",
+        headers={"mcp-session-id": session_id},
+        json={"jsonrpc": "2.0", "id": 4, "method": ["tools/list"]},
+    )
+    assert response.status_code == 200
+    assert response.json()["error"]["code"] == -32601
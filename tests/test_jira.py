@@ -0,0 +1,295 @@
+"""Tests for the JIRA provider."""
+
+import asyncio
+
+import httpx
+import orjson
+import pytest
+
+from gl_mcp.mcp.server import MCPServerManager
+from gl_mcp.providers import base
+from gl_mcp.providers.jira import JiraProvider
+
+
+def _provider(handler) -> JiraProvider:
+    """Create a JIRA provider whose client is served by a mock transport."""
+    provider = JiraProvider()
+    provider._client = httpx.AsyncClient(
+        base_url="https://jira.example.com",
+        transport=httpx.MockTransport(handler),
+    )
+    return provider
+
+
+async def test_transition_issue_uses_cached_transitions() -> None:
+    """Test a retry after an unknown transition name skips the transitions lookup."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append((request.method, request.url.path))
+        if request.method == "GET":
+            return httpx.Response(
+                200,
+                json={"transitions": [{"id": "31", "name": "Done"}]},
+            )
+        return httpx.Response(204)
+
+    provider = _provider(handler)
+    assert (await provider._transition_issue("GL-1", "Closed")).startswith("Transition 'Closed'")
+    assert await provider._transition_issue("GL-1", "done") == "Transitioned GL-1 to 'done'"
+
+    assert calls == [
+        ("GET", "/rest/api/3/issue/GL-1/transitions"),
+        ("POST", "/rest/api/3/issue/GL-1/transitions"),
+    ]
+
+
+async def test_transition_issue_refetches_after_transition() -> None:
+    """Test consecutive transitions on one issue each look up the new status's transitions."""
+    calls = []
+    workflow = iter([
+        [{"id": "21", "name": "In Progress"}],
+        [{"id": "31", "name": "Done"}],
+    ])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        if request.method == "GET":
+            return httpx.Response(200, json={"transitions": next(workflow)})
+        return httpx.Response(204)
+
+    provider = _provider(handler)
+    await provider._transition_issue("GL-1", "In Progress")
+    result = await provider._transition_issue("GL-1", "Done")
+
+    assert result == "Transitioned GL-1 to 'Done'"
+    assert calls == ["GET", "POST", "GET", "POST"]
+
+
+async def test_transition_issue_refetches_stale_transition() -> None:
+    """Test a rejected cached transition id is refreshed and retried."""
+    calls = []
+    transition_ids = iter(["31", "41"])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        if request.method == "GET":
+            return httpx.Response(
+                200,
+                json={"transitions": [{"id": next(transition_ids), "name": "Done"}]},
+            )
+        if b'"31"' in request.content:
+            return httpx.Response(400)
+        return httpx.Response(204)
+
+    provider = _provider(handler)
+    await provider._transition_issue("GL-1", "Closed")
+    result = await provider._transition_issue("GL-1", "Done")
+
+    assert result == "Transitioned GL-1 to 'Done'"
+    assert calls == ["GET", "POST", "GET", "POST"]
+
+
+async def test_transition_issue_not_found() -> None:
+    """Test an unknown transition lists the available ones."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            json={"transitions": [{"id": "11", "name": "To Do"}, {"id": "31", "name": "Done"}]},
+        )
+
+    provider = _provider(handler)
+    result = await provider._transition_issue("GL-1", "Review")
+
+    assert result == "Transition 'Review' not found. Available: To Do, Done"
+
+
+def test_extract_text_from_adf() -> None:
+    """Test ADF text nodes are joined in document order."""
+    adf = {
+        "type": "doc",
+        "content": [
+            {
+                "type": "paragraph",
+                "content": [
+                    {"type": "text", "text": "first"},
+                    {"type": "text", "text": "second"},
+                ],
+            },
+            {"type": "paragraph", "content": [{"type": "text", "text": "third"}]},
+        ],
+    }
+    provider = JiraProvider()
+
+    assert provider._extract_text_from_adf(adf) == "first second third"
+    assert provider._extract_text_from_adf({"type": "doc", "content": []}) == "No description"
+
+
+async def test_concurrent_get_issue_is_batched() -> None:
+    """Test concurrent get_issue calls share a single search request."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append((request.method, request.url.path))
+        return httpx.Response(
+            200,
+            json={
+                "issues": [
+                    {"key": "GL-1", "fields": {"summary": "One"}},
+                    {"key": "GL-2", "fields": {"summary": "Two"}},
+                ]
+            },
+        )
+
+    provider = _provider(handler)
+    first, second = await asyncio.gather(
+        provider._get_issue("GL-1"),
+        provider._get_issue("GL-2"),
+    )
+
+    assert first.startswith("**GL-1: One**")
+    assert second.startswith("**GL-2: Two**")
+    assert calls == [("POST", "/rest/api/3/search/jql")]
+
+
+async def test_search_issues_formats_streamed_results() -> None:
+    """Test search results are formatted one line per issue."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            json={
+                "issues": [
+                    {"key": "GL-1", "fields": {"summary": "One", "status": {"name": "Done"}}},
+                    {"key": "GL-2", "fields": {"summary": "Two"}},
+                ]
+            },
+        )
+
+    provider = _provider(handler)
+
+    assert await provider._search_issues("project = GL") == (
+        "Found 2 issues:\n\n- GL-1: One [Done]\n- GL-2: Two [Unknown]"
+    )
+
+
+async def test_search_issues_no_results() -> None:
+    """Test an empty search result."""
+    provider = _provider(lambda request: httpx.Response(200, json={"issues": []}))
+
+    assert await provider._search_issues("project = GL") == "No issues found matching the query."
+
+
+async def test_get_issue_formats_issue() -> None:
+    """Test a single issue is rendered with its fields and description."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            json={
+                "key": "GL-1",
+                "fields": {
+                    "summary": "One",
+                    "status": {"name": "Done"},
+                    "priority": {"name": "High"},
+                    "issuetype": {"name": "Bug"},
+                    "description": {
+                        "type": "doc",
+                        "content": [{"type": "text", "text": "Broken"}],
+                    },
+                },
+            },
+        )
+
+    provider = _provider(handler)
+
+    assert await provider._get_issue("GL-1") == (
+        "**GL-1: One**\n\n**Type:** Bug\n**Status:** Done\n**Priority:** High\n\n"
+        "**Description:**\nBroken\n"
+    )
+
+
+async def test_create_issue_without_description() -> None:
+    """Test creating an issue sends an empty ADF description."""
+    bodies = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(orjson.loads(request.content))
+        return httpx.Response(201, json={"key": "GL-9"})
+
+    provider = _provider(handler)
+
+    assert await provider._create_issue("GL", "New") == "Created issue: GL-9"
+    assert bodies[0]["fields"]["description"] == {
+        "type": "doc",
+        "version": 1,
+        "content": [{"type": "paragraph", "content": []}],
+    }
+
+
+async def test_get_issue_revalidates_with_etag() -> None:
+    """Test a repeated get_issue sends If-None-Match and reuses the cached issue."""
+    seen_etags = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_etags.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200,
+            headers={"ETag": '"v1"'},
+            json={"key": "GL-1", "fields": {"summary": "One"}},
+        )
+
+    provider = _provider(handler)
+    first = await provider._get_issue("GL-1")
+    second = await provider._get_issue("GL-1")
+
+    assert first == second
+    assert first.startswith("**GL-1: One**")
+    assert seen_etags == [None, '"v1"']
+
+
+async def test_rejected_credentials_disable_provider(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a 401 disables the provider, withdraws its tools and skips later requests."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(401)
+
+    manager = MCPServerManager()
+    monkeypatch.setattr(base, "get_server_manager", lambda: manager)
+    provider = _provider(handler)
+    provider._credentials_valid = True
+    provider.register_tools()
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await provider._create_issue("GL", "New")
+    with pytest.raises(PermissionError):
+        await provider._create_issue("GL", "New")
+
+    assert not provider.is_available
+    assert manager.tool_names == []
+    assert manager.tools_payload == []
+    assert manager.tools_list_encoded == b'{"tools":[]}'
+    assert calls == ["/rest/api/3/issue"]
+
+
+async def test_verify_connection_error_keeps_provider_enabled() -> None:
+    """Test a failed credential check that is not a 401 leaves the provider usable."""
+    attempts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request.url.path)
+        if len(attempts) == 1:
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(200, json={"issues": []})
+
+    provider = _provider(handler)
+    provider._credentials_valid = True
+
+    assert await provider.verify() is False
+    assert provider.is_available
+    assert await provider._search_issues("project = GL") == "No issues found matching the query."
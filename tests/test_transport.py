@@ -0,0 +1,87 @@
+"""Tests for MCP session storage and the SSE stream."""
+
+import asyncio
+
+import pytest
+from starlette.requests import Request
+
+from gl_mcp.mcp import transport
+from gl_mcp.mcp.transport import Session, _SessionCache
+
+
+class FakeTimer:
+    """Manually advanced clock for TTL tests."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _session() -> Session:
+    """Create a session that has opened an SSE stream."""
+    session = Session(user_roles=[])
+    session.message_queue = asyncio.Queue()
+    return session
+
+
+def test_session_expires_after_ttl() -> None:
+    """Test an idle session expires and its queue is released."""
+    timer = FakeTimer()
+    cache = _SessionCache(maxsize=10, ttl=60, timer=timer)
+    session = _session()
+    cache["a"] = session
+
+    timer.now = 30
+    cache["a"] = session  # touched, so the TTL restarts
+    timer.now = 80
+    assert "a" in cache
+
+    timer.now = 91
+    assert cache.expire() == [("a", session)]
+    assert session.message_queue is None
+
+
+def test_session_evicted_when_full() -> None:
+    """Test the least recently used session is evicted and released."""
+    cache = _SessionCache(maxsize=2, ttl=60, timer=FakeTimer())
+    first, second, third = _session(), _session(), _session()
+    cache["a"] = first
+    cache["b"] = second
+    cache.get("a")
+    cache["c"] = third
+
+    assert set(cache) == {"a", "c"}
+    assert second.message_queue is None
+    assert first.message_queue is not None
+
+
+async def test_sse_stream_ends_with_session(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test an open SSE stream refreshes its session and ends once it is removed."""
+    monkeypatch.setattr(transport, "_KEEPALIVE_INTERVAL", 0)
+    session_id = transport._next_session_id()
+    with transport._sessions_lock:
+        transport._sessions[session_id] = Session(user_roles=[])
+
+    endpoint = next(
+        route.endpoint
+        for route in transport.get_mcp_router().routes
+        if "GET" in route.methods
+    )
+    request = Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/mcp",
+        "query_string": b"",
+        "headers": [
+            (b"mcp-session-id", session_id.encode()),
+            (b"accept", b"text/event-stream"),
+        ],
+    })
+    stream = (await endpoint(request)).body_iterator
+
+    assert await anext(stream) == b": keep-alive\n\n"
+    assert transport._remove_session(session_id)
+    with pytest.raises(StopAsyncIteration):
+        await anext(stream)